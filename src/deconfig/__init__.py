@@ -16,52 +16,244 @@ class ExampleConfig:
 ```
 """
 
-from typing import Optional, TypeVar, Callable, List, Type
+import sys
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple, TypeVar, Callable
+from typing import List, Type, TYPE_CHECKING
 
-from deconfig.core import FieldUtil, AdapterError, AdapterBase
-from deconfig.ini_adapter import IniAdapter
+from deconfig.core import FieldUtil, AdapterError, AdapterBase, _MISSING
 from deconfig.env_adapter import EnvAdapter
 from deconfig.__version__ import __version__, __author__, __license__
 
+if TYPE_CHECKING:
+    from inspect import Parameter
+    from deconfig.ini_adapter import IniAdapter
+
 
 T = TypeVar("T")
 U = TypeVar("U")
 
+# Attribute on config instances holding their cached field responses
+_INSTANCE_CACHE_ATTRIBUTE = "_deconfig_cache"
+# Attribute on config classes holding names of their field methods
+_CLASS_FIELDS_ATTRIBUTE = "_deconfig_fields"
+# Attribute on config classes counting reset_cache calls, instance caches
+# built under an older generation are dropped
+_CLASS_CACHE_GENERATION_ATTRIBUTE = "_deconfig_cache_generation"
+# Method every adapter must have, see AdapterBase.get_field
+_GET_FIELD_METHOD = AdapterBase.get_field.__name__
+
 
-def _decorated_config_decorator(getter_function: Callable[..., T]) -> Callable[..., T]:
+def _get_instance_cache(instance: Any) -> Optional[Dict[Hashable, Any]]:
     """
-    Decorator that will handle all logic for getting field value.
+    Get response cache of the config instance the getter was called on.
+    Returns None when instance cannot hold a cache, e.g. getter not called as a method.
+    """
+    try:
+        instance_dict = instance.__dict__
+    except AttributeError:
+        return None
+    if not isinstance(instance_dict, dict):
+        return None
+    generation = getattr(type(instance), _CLASS_CACHE_GENERATION_ATTRIBUTE, 0)
+    # Cache is created on first miss, so cache hits allocate nothing. It records
+    # its owner, as copies and unpickled instances get the cache of the original
+    owner = id(instance)
+    generation_cache = instance_dict.get(_INSTANCE_CACHE_ATTRIBUTE)
+    if (
+        generation_cache is None
+        or generation_cache[0] != generation
+        or generation_cache[1] != owner
+    ):
+        generation_cache = (generation, owner, {})
+        instance_dict[_INSTANCE_CACHE_ATTRIBUTE] = generation_cache
+    return generation_cache[2]
+
+
+def _increment_cache_generation(class_: type) -> None:
+    """
+    Invalidate response caches of all instances of the class and its subclasses.
     """
+    generation = getattr(class_, _CLASS_CACHE_GENERATION_ATTRIBUTE, 0)
+    setattr(class_, _CLASS_CACHE_GENERATION_ATTRIBUTE, generation + 1)
+    for subclass in type.__subclasses__(class_):
+        _increment_cache_generation(subclass)
 
-    # Get decorator values from getter function
-    name = FieldUtil.get_name(getter_function)
-    adapters = FieldUtil.get_adapters(getter_function)
 
-    optional_ = FieldUtil.is_optional(getter_function)
+def _get_parameters(getter_function: Callable[..., Any]) -> Optional[List["Parameter"]]:
+    """
+    Get parameters of getter, None if signature cannot be inspected.
+    """
+    # inspect is slow to import, so it is only imported once a config is decorated
+    from inspect import signature  # pylint: disable=import-outside-toplevel
+
+    try:
+        return list(signature(getter_function).parameters.values())
+    except (TypeError, ValueError):
+        return None
 
-    def build_response_from_config(*args, **kwargs) -> T:
-        """
-        Get field value from adapters or getter function.
-        """
-        for adapter_ in adapters:
+
+def _takes_arguments(parameters: Optional[List["Parameter"]]) -> bool:
+    """
+    Check if getter takes arguments other than the config instance.
+    """
+    if parameters is None:
+        return False
+    return len(parameters) > 1 or any(
+        p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in parameters
+    )
+
+
+def _takes_only_instance(parameters: Optional[List["Parameter"]]) -> bool:
+    """
+    Check if getter takes just the config instance, i.e. `def get_foo(self)`.
+    """
+    if parameters is None or len(parameters) != 1:
+        return False
+    parameter = parameters[0]
+    return parameter.kind in (
+        parameter.POSITIONAL_ONLY,
+        parameter.POSITIONAL_OR_KEYWORD,
+    )
+
+
+def _build_arguments_cache_key(
+    key: str, args: Sequence[Any], kwargs: Dict[str, Any]
+) -> Optional[Hashable]:
+    """
+    Build cache key for getter called with given arguments.
+    Returns None when arguments are not hashable.
+    """
+    cache_key = (key, tuple(args[1:]), frozenset(kwargs.items()))
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
+def _build_adapter_response(
+    name: str,
+    getter_function: Callable[..., T],
+    adapter_getters: Sequence[Callable[..., Any]],
+    build_fallback_response: Callable[..., T],
+) -> Callable[..., T]:
+    """
+    Build callable getting field value from adapters or fallback, without raising
+    another error when all adapters miss.
+    """
+    if len(adapter_getters) == 1:
+        # Most fields have a single adapter, which needs no loop
+        (get_field,) = adapter_getters
+
+        def build_single_adapter_response(*args, **kwargs) -> T:
             try:
-                return adapter_.get_field(name, getter_function, *args, **kwargs)
-            except AdapterError:
-                continue
-        raise AdapterError("Value not found in any config")
+                return get_field(name, getter_function, *args, **kwargs)
+            except AdapterError as e:
+                error = e
+            return build_fallback_response(error, *args, **kwargs)
+
+        return build_single_adapter_response
 
-    def decorated_config_wrapper(*args, **kwargs) -> T:
-        if FieldUtil.has_cached_response(getter_function):
-            return FieldUtil.get_cached_response(getter_function)
+    def build_adapter_response(*args, **kwargs) -> T:
+        error = None
+        for get_field in adapter_getters:
+            try:
+                return get_field(name, getter_function, *args, **kwargs)
+            except AdapterError as e:
+                error = e
+        return build_fallback_response(error, *args, **kwargs)
+
+    return build_adapter_response
+
+
+def _decorated_config_decorator(
+    getter_function: Callable[..., T], cache_key: Optional[str] = None
+) -> Callable[..., T]:
+    """
+    Decorator that will handle all logic for getting field value.
+    Responses are cached on config instances under cache_key,
+    attribute name of the field by default.
+    """
 
-        try:
-            response = build_response_from_config(*args, **kwargs)
-        except AdapterError as e:
-            if optional_ is False:
-                raise ValueError(f"Field {name} not found in any config.") from e
-            response = getter_function(*args, **kwargs)
-        FieldUtil.set_cached_response(getter_function, response)
-        return response
+    # Get decorator values from getter function once, so the wrapper
+    # only reads closure locals on every call
+    name = FieldUtil.get_name(getter_function)
+    getter_meta = FieldUtil.get_meta(getter_function)
+    adapters = getter_meta.adapters
+    required = getter_meta.optional is False
+    adapter_getters = tuple(adapter_.get_field for adapter_ in adapters)
+    parameters = _get_parameters(getter_function)
+    if cache_key is None:
+        cache_key = getter_function.__name__
+
+    # Pick how a field missing in all adapters is handled once, instead of
+    # checking if field is optional on every call
+    if required:
+
+        def build_fallback_response(error: Optional[AdapterError], *_, **__) -> T:
+            raise ValueError(f"Field {name} not found in any config.") from error
+
+    else:
+
+        def build_fallback_response(_: Optional[AdapterError], *args, **kwargs) -> T:
+            return getter_function(*args, **kwargs)
+
+    build_response = _build_adapter_response(
+        name, getter_function, adapter_getters, build_fallback_response
+    )
+
+    if _takes_only_instance(parameters):
+        # Most getters only take self, which needs no argument packing
+        def decorated_config_wrapper(self) -> T:
+            instance_cache = _get_instance_cache(self)
+            if instance_cache is None:
+                cached_response = getter_meta.cached_response
+            else:
+                cached_response = instance_cache.get(cache_key, _MISSING)
+            if cached_response is not _MISSING:
+                return cached_response
+
+            response = build_response(self)
+            if instance_cache is None:
+                getter_meta.cached_response = response
+            else:
+                instance_cache[cache_key] = response
+            return response
+
+    else:
+        # Getters with arguments need a cache entry per arguments
+        takes_arguments = _takes_arguments(parameters)
+
+        def decorated_config_wrapper(*args, **kwargs) -> T:
+            # Cache per instance, falling back to getter meta for non-method calls.
+            # First argument is taken for the instance, so a non-method call with a
+            # single argument shares the getter meta response with other calls
+            instance_cache = _get_instance_cache(args[0]) if args else None
+            arguments_cache_key = cache_key
+            # Getters taking *args or **kwargs are often called with self only,
+            # which needs no key for the arguments
+            if takes_arguments and (len(args) > 1 or kwargs):
+                if instance_cache is not None:
+                    arguments_cache_key = _build_arguments_cache_key(
+                        cache_key, args, kwargs
+                    )
+                if instance_cache is None or arguments_cache_key is None:
+                    # Getter meta holds a single response and unhashable arguments
+                    # have no key, so these responses are not cached
+                    return build_response(*args, **kwargs)
+            if instance_cache is None:
+                cached_response = getter_meta.cached_response
+            else:
+                cached_response = instance_cache.get(arguments_cache_key, _MISSING)
+            if cached_response is not _MISSING:
+                return cached_response
+
+            response = build_response(*args, **kwargs)
+            if instance_cache is None:
+                getter_meta.cached_response = response
+            else:
+                instance_cache[arguments_cache_key] = response
+            return response
 
     FieldUtil.set_original_function(decorated_config_wrapper, getter_function)
     return decorated_config_wrapper
@@ -69,17 +261,23 @@ def _decorated_config_decorator(getter_function: Callable[..., T]) -> Callable[.
 
 def reset_cache(obj: Type[AdapterBase]):
     """
-    Reset cache for all fields in the class.
+    Reset cache for all fields in the class or config instance.
+    Resetting a class resets all of its instances as well.
     """
-    for name in dir(obj):
-        getter_function = getattr(obj, name)
-        if not callable(getter_function) or not FieldUtil.has_original_function(
-            getter_function
-        ):
+    if isinstance(obj, type):
+        _increment_cache_generation(obj)
+    else:
+        instance_dict = getattr(obj, "__dict__", None)
+        if isinstance(instance_dict, dict):
+            instance_dict.pop(_INSTANCE_CACHE_ATTRIBUTE, None)
+
+    for name in getattr(obj, _CLASS_FIELDS_ATTRIBUTE, ()):
+        # Subclasses can override inherited fields with plain methods
+        wrapper_function = getattr(obj, name, None)
+        if not FieldUtil.has_original_function(wrapper_function):
             continue
-        getter_function = FieldUtil.get_original_function(getter_function)
-        if FieldUtil.has_cached_response(getter_function):
-            FieldUtil.delete_cached_response(getter_function)
+        getter_function = FieldUtil.get_original_function(wrapper_function)
+        FieldUtil.delete_cached_response(getter_function)
 
 
 def field(name: str) -> Callable[..., T]:
@@ -100,6 +298,9 @@ def field(name: str) -> Callable[..., T]:
     except (ValueError, TypeError) as e:
         raise TypeError("Name should be a string.") from e
 
+    # Name is passed to adapters on every lookup, interning speeds up comparisons
+    name = sys.intern(name)
+
     def wrapper(func: Callable[..., T]) -> Callable[..., T]:
         FieldUtil.set_name(func, name)
         FieldUtil.initialize_adapter_configs(func)
@@ -133,7 +334,7 @@ def add_adapter(adapter_: AdapterBase) -> Callable[..., T]:
     if adapter_ is None:
         raise TypeError("Adapter is required.")
 
-    if not hasattr(adapter_, AdapterBase.get_field.__name__):
+    if not hasattr(adapter_, _GET_FIELD_METHOD):
         raise TypeError("Adapter must extend AdapterBase or have get_field method.")
 
     def wrapper(func: Callable[..., T]) -> Callable[..., T]:
@@ -143,46 +344,69 @@ def add_adapter(adapter_: AdapterBase) -> Callable[..., T]:
     return wrapper
 
 
-_adapters: List[AdapterBase] = [EnvAdapter()]
+_adapters: Tuple[AdapterBase, ...] = (EnvAdapter(),)
 
 
 def set_default_adapters(*adapters: AdapterBase) -> None:
     """Setting default adapters"""
     if len(adapters) == 0:
         raise TypeError("At least one adapter is required.")
-    if not all(hasattr(a, AdapterBase.get_field.__name__) for a in adapters):
+    if not all(hasattr(a, _GET_FIELD_METHOD) for a in adapters):
         raise TypeError("Adapter must extend AdapterBase or have get_field method.")
     global _adapters  # pylint: disable=global-statement
-    _adapters = adapters
+    _adapters = tuple(adapters)
 
 
 def config(adapters: Optional[List[AdapterBase]] = None):
     """
     Decorator for the config class.
     """
-    if adapters is None:
-        adapters = _adapters
+    # Fields without own adapters share this copy, so later changes
+    # to the passed list do not affect fields
+    adapters = list(_adapters if adapters is None else adapters)
 
     def wrapper(class_: Type[AdapterBase]):
+        # Fields inherited from other config classes are kept
+        field_names = dict.fromkeys(getattr(class_, _CLASS_FIELDS_ATTRIBUTE, ()))
         for name, getter_function in class_.__dict__.items():
-            # Skip non-field methods
-            if not callable(getter_function) or not FieldUtil.has_name(getter_function):
+            # Skip non-field members, only @field functions have a name
+            meta = FieldUtil.get_meta(getter_function)
+            if meta is None or meta.name is None:
                 continue
 
             # Field adapters get priority
-            field_adapters = adapters
-            if FieldUtil.get_adapters(getter_function) is not None:
-                field_adapters = [*FieldUtil.get_adapters(getter_function), *adapters]
-            FieldUtil.set_adapters(getter_function, field_adapters)
+            if meta.adapters:
+                meta.adapters = [*meta.adapters, *adapters]
+            else:
+                meta.adapters = adapters
 
             # Decorate with yield, that will handle all logic
-            setattr(class_, name, _decorated_config_decorator(getter_function))
-
+            setattr(class_, name, _decorated_config_decorator(getter_function, name))
+            field_names[name] = None
+
+        setattr(class_, _CLASS_FIELDS_ATTRIBUTE, tuple(field_names))
+        # Generation is read on every cached read, a class attribute
+        # is found faster than a getattr default
+        generation = getattr(class_, _CLASS_CACHE_GENERATION_ATTRIBUTE, 0)
+        setattr(class_, _CLASS_CACHE_GENERATION_ATTRIBUTE, generation)
         return class_
 
     return wrapper
 
 
+def __getattr__(name: str) -> Any:  # pylint: disable=invalid-name
+    """
+    Import IniAdapter only when used, as it pulls in configparser.
+    """
+    if name == "IniAdapter":
+        # pylint: disable=import-outside-toplevel
+        from deconfig.ini_adapter import IniAdapter
+
+        globals()[name] = IniAdapter
+        return IniAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "field",
     "optional",
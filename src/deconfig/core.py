@@ -12,6 +12,11 @@ from typing import Dict, Type
 T = TypeVar("T")
 U = TypeVar("U")
 
+# Marks a missing value where None is a valid value
+_MISSING = object()
+# Attribute on field functions holding their _FieldMeta
+_META_ATTRIBUTE = "_deconfig_meta"
+
 
 def is_callable(callback: Callable[..., T]) -> bool:
     """
@@ -54,6 +59,34 @@ class AdapterBase(ABC):
         """
 
 
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class _FieldMeta:
+    """
+    Properties of a field, stored as a single attribute on the field function.
+    """
+
+    __slots__ = (
+        "name",
+        "adapters",
+        "adapter_configs",
+        "optional",
+        "validation_callbacks",
+        "transform_callbacks",
+        "cached_response",
+        "original_function",
+    )
+
+    def __init__(self):
+        self.name: Optional[str] = None
+        self.adapters: Optional[List[AdapterBase]] = None
+        self.adapter_configs: Optional[Dict[Type[AdapterBase], Any]] = None
+        self.optional: bool = False
+        self.validation_callbacks: Optional[List[Callable[..., None]]] = None
+        self.transform_callbacks: Optional[List[Callable[..., Any]]] = None
+        self.cached_response: Any = _MISSING
+        self.original_function: Optional[Callable[..., Any]] = None
+
+
 # pylint: disable=too-many-public-methods
 class FieldUtil:
     """
@@ -61,207 +94,245 @@ class FieldUtil:
     These properties are how the library knows how to get the field value.
     """
 
-    @classmethod
-    def get_adapter_configs(
-        cls, function: Callable[..., T]
-    ) -> Dict[Type[AdapterBase], Any]:
+    @staticmethod
+    def get_meta(function: Callable[..., T]) -> Optional[_FieldMeta]:
+        """
+        Get field properties from function, None if function is not a field.
+        """
+        return getattr(function, _META_ATTRIBUTE, None)
+
+    @staticmethod
+    def initialize_meta(function: Callable[..., T]) -> _FieldMeta:
+        """
+        Get field properties from function, creating them if not present.
+        """
+        meta = getattr(function, _META_ATTRIBUTE, None)
+        if meta is None:
+            meta = _FieldMeta()
+            setattr(function, _META_ATTRIBUTE, meta)
+        return meta
+
+    @staticmethod
+    def get_adapter_configs(function: Callable[..., T]) -> Dict[Type[AdapterBase], Any]:
         """
         Get adapter list from function.
         """
-        if not hasattr(function, "adapter_configs"):
+        meta = FieldUtil.get_meta(function)
+        if meta is None or meta.adapter_configs is None:
             raise ValueError("Please decorate the class with @config.")
-        return getattr(function, "adapter_configs")
+        return meta.adapter_configs
 
-    @classmethod
-    def initialize_adapter_configs(cls, function: Callable[..., T]):
+    @staticmethod
+    def get_adapter_config(
+        function: Callable[..., T], adapter: Type[AdapterBase]
+    ) -> Optional[Any]:
+        """
+        Get config of a single adapter from function, None if adapter has no config.
+        """
+        meta = FieldUtil.get_meta(function)
+        if meta is None or meta.adapter_configs is None:
+            raise ValueError("Please decorate the class with @config.")
+        return meta.adapter_configs.get(adapter)
+
+    @staticmethod
+    def initialize_adapter_configs(function: Callable[..., T]):
         """
         Set adapter list to function.
         """
-        setattr(function, "adapter_configs", {})
+        FieldUtil.initialize_meta(function).adapter_configs = {}
 
-    @classmethod
+    @staticmethod
     def upsert_adapter_config(
-        cls, function: Callable[..., T], adapter: Type[AdapterBase], config: Any
+        function: Callable[..., T], adapter: Type[AdapterBase], config: Any
     ):
         """
         Add adapter to the function.
         """
-        adapters = cls.get_adapter_configs(function)
-        adapters[adapter] = config
-        setattr(function, "adapter_configs", adapters)
+        FieldUtil.get_adapter_configs(function)[adapter] = config
 
-    @classmethod
-    def get_adapters(cls, function: Callable[..., T]) -> Optional[List[AdapterBase]]:
+    @staticmethod
+    def get_adapters(function: Callable[..., T]) -> Optional[List[AdapterBase]]:
         """
         Get adapter list from function of @config() class
         """
-        if not hasattr(function, "adapters"):
+        meta = FieldUtil.get_meta(function)
+        if meta is None:
             return None
-        return getattr(function, "adapters")
+        return meta.adapters
 
-    @classmethod
-    def set_adapters(
-        cls, function: Callable[..., T], adapters: List[AdapterBase]
-    ) -> None:
+    @staticmethod
+    def set_adapters(function: Callable[..., T], adapters: List[AdapterBase]) -> None:
         """
         Set adapter list to function.
         """
-        setattr(function, "adapters", adapters)
+        FieldUtil.initialize_meta(function).adapters = adapters
 
-    @classmethod
-    def has_adapters(cls, function: Callable[..., T]) -> bool:
+    @staticmethod
+    def has_adapters(function: Callable[..., T]) -> bool:
         """
         Check if function has adapters.
         """
-        return hasattr(function, "adapters")
+        return FieldUtil.get_adapters(function) is not None
 
-    @classmethod
-    def add_adapter(cls, function: Callable[..., T], adapter_: AdapterBase) -> None:
+    @staticmethod
+    def add_adapter(function: Callable[..., T], adapter_: AdapterBase) -> None:
         """
         Add adapter to the function.
         """
-        adapters = cls.get_adapters(function) or []
+        adapters = FieldUtil.get_adapters(function) or []
         adapters.insert(0, adapter_)
-        cls.set_adapters(function, adapters)
+        FieldUtil.set_adapters(function, adapters)
 
-    @classmethod
-    def set_name(cls, function: Callable[..., T], name: str) -> None:
+    @staticmethod
+    def set_name(function: Callable[..., T], name: str) -> None:
         """
         Add name to the function.
         """
-        setattr(function, "name", name)
+        FieldUtil.initialize_meta(function).name = name
 
-    @classmethod
-    def has_name(cls, function: Callable[..., T]) -> bool:
+    @staticmethod
+    def has_name(function: Callable[..., T]) -> bool:
         """
         Check if function has name set using @field decorator.
         """
-        return hasattr(function, "name")
+        meta = FieldUtil.get_meta(function)
+        return meta is not None and meta.name is not None
 
-    @classmethod
-    def get_name(cls, function: Callable[..., T]) -> str:
+    @staticmethod
+    def get_name(function: Callable[..., T]) -> str:
         """
         Get name from the function.
         """
-        try:
-            return getattr(function, "name")
-        except AttributeError as e:
-            raise ValueError("Please decorate the field with @name.") from e
+        meta = FieldUtil.get_meta(function)
+        if meta is None or meta.name is None:
+            raise ValueError("Please decorate the field with @name.")
+        return meta.name
 
-    @classmethod
+    @staticmethod
     def add_validation_callback(
-        cls, function: Callable[..., T], callback: Callable[..., T]
+        function: Callable[..., T], callback: Callable[..., T]
     ) -> Callable[..., T]:
         """
         Add validation callback to the function.
         """
-        validation_callbacks = []
-        if hasattr(function, "validation_callbacks"):
-            validation_callbacks = getattr(function, "validation_callbacks")
-        validation_callbacks.append(callback)
-        setattr(function, "validation_callbacks", validation_callbacks)
+        meta = FieldUtil.initialize_meta(function)
+        if meta.validation_callbacks is None:
+            meta.validation_callbacks = []
+        meta.validation_callbacks.append(callback)
         return function
 
-    @classmethod
+    @staticmethod
     def get_validation_callbacks(
-        cls, function: Callable[..., T]
+        function: Callable[..., T]
     ) -> List[Callable[..., None]]:
         """
         Get validation callback from the function.
         """
-        return getattr(function, "validation_callbacks", [])
+        meta = FieldUtil.get_meta(function)
+        if meta is None or meta.validation_callbacks is None:
+            return []
+        return meta.validation_callbacks
 
-    @classmethod
-    def set_optional(cls, function: Callable[..., T], is_optional: bool = True) -> None:
+    @staticmethod
+    def set_optional(function: Callable[..., T], is_optional: bool = True) -> None:
         """
         Set optional to the function.
         """
-        setattr(function, "optional", is_optional)
+        FieldUtil.initialize_meta(function).optional = is_optional
 
-    @classmethod
-    def is_optional(cls, function: Callable[..., T]) -> bool:
+    @staticmethod
+    def is_optional(function: Callable[..., T]) -> bool:
         """
         Get optional from the function.
         """
-        return getattr(function, "optional", False)
+        meta = FieldUtil.get_meta(function)
+        if meta is None:
+            return False
+        return meta.optional
 
-    @classmethod
+    @staticmethod
     def add_transform_callback(
-        cls, function: Callable[..., T], callback: Callable[..., U]
+        function: Callable[..., T], callback: Callable[..., U]
     ) -> Callable[..., U]:
         """
         Add transform callback to the function.
         """
-        transformer_callbacks = []
-        if hasattr(function, "transform_callbacks"):
-            transformer_callbacks = getattr(function, "transform_callbacks")
-        transformer_callbacks.append(callback)
-        setattr(function, "transform_callbacks", transformer_callbacks)
+        meta = FieldUtil.initialize_meta(function)
+        if meta.transform_callbacks is None:
+            meta.transform_callbacks = []
+        meta.transform_callbacks.append(callback)
         return function
 
-    @classmethod
-    def get_transform_callbacks(
-        cls, function: Callable[..., T]
-    ) -> List[Callable[..., U]]:
+    @staticmethod
+    def get_transform_callbacks(function: Callable[..., T]) -> List[Callable[..., U]]:
         """
         Get transform callback from the function.
         """
-        return getattr(function, "transform_callbacks", [])
+        meta = FieldUtil.get_meta(function)
+        if meta is None or meta.transform_callbacks is None:
+            return []
+        return meta.transform_callbacks
 
-    @classmethod
-    def set_cached_response(cls, function: Callable[..., T], response: T) -> None:
+    @staticmethod
+    def set_cached_response(function: Callable[..., T], response: T) -> None:
         """
         Set cache response to the function.
         """
-        setattr(function, "cached_response", response)
+        FieldUtil.initialize_meta(function).cached_response = response
 
-    @classmethod
-    def has_cached_response(cls, function: Callable[..., T]) -> bool:
+    @staticmethod
+    def has_cached_response(function: Callable[..., T]) -> bool:
         """
         Check if function has cache response.
         """
-        return hasattr(function, "cached_response")
+        meta = FieldUtil.get_meta(function)
+        return meta is not None and meta.cached_response is not _MISSING
 
-    @classmethod
-    def get_cached_response(cls, function: Callable[..., T]) -> Optional[T]:
+    @staticmethod
+    def get_cached_response(function: Callable[..., T]) -> Optional[T]:
         """
         Get cache response from the function.
         """
-        if not cls.has_cached_response(function):
+        meta = FieldUtil.get_meta(function)
+        response = _MISSING if meta is None else meta.cached_response
+        if response is _MISSING:
             raise ValueError("Cache response not found.")
-        return getattr(function, "cached_response")
+        return response
 
-    @classmethod
-    def delete_cached_response(cls, function: Callable[..., T]) -> None:
+    @staticmethod
+    def delete_cached_response(function: Callable[..., T]) -> None:
         """
         Delete cache response from the function.
         """
-        if cls.has_cached_response(function):
-            delattr(function, "cached_response")
+        meta = FieldUtil.get_meta(function)
+        if meta is not None:
+            meta.cached_response = _MISSING
 
-    @classmethod
+    @staticmethod
     def set_original_function(
-        cls, wrapper_function: Callable[..., T], original_function: Callable[..., T]
+        wrapper_function: Callable[..., T], original_function: Callable[..., T]
     ) -> None:
         """
         Set original function to the wrapper function.
         """
-        setattr(wrapper_function, "original_function", original_function)
+        FieldUtil.initialize_meta(wrapper_function).original_function = (
+            original_function
+        )
 
-    @classmethod
-    def get_original_function(
-        cls, wrapper_function: Callable[..., T]
-    ) -> Callable[..., T]:
+    @staticmethod
+    def get_original_function(wrapper_function: Callable[..., T]) -> Callable[..., T]:
         """
         Get original function from the wrapper function.
         """
-        if not cls.has_original_function(wrapper_function):
+        meta = FieldUtil.get_meta(wrapper_function)
+        if meta is None or meta.original_function is None:
             raise ValueError("Original function not found.")
-        return getattr(wrapper_function, "original_function")
+        return meta.original_function
 
-    @classmethod
-    def has_original_function(cls, wrapper_function: Callable[..., T]) -> bool:
+    @staticmethod
+    def has_original_function(wrapper_function: Callable[..., T]) -> bool:
         """
         Check if function has original function.
         """
-        return hasattr(wrapper_function, "original_function")
+        meta = FieldUtil.get_meta(wrapper_function)
+        return meta is not None and meta.original_function is not None
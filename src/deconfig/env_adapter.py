@@ -19,8 +19,7 @@ class ExampleConfig:
 """
 
 import os
-from dataclasses import dataclass
-from typing import Callable, Optional, TypeVar
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
 from deconfig.core import AdapterBase, FieldUtil, AdapterError
 
@@ -28,10 +27,17 @@ from deconfig.core import AdapterBase, FieldUtil, AdapterError
 T = TypeVar("T")
 
 
-@dataclass
+# pylint: disable=too-few-public-methods
 class _EnvAdapterConfig:
-    override_name: Optional[str] = None
-    ignore_prefix: bool = False
+    """
+    Environment variable options of a field, set with @EnvAdapter.configure.
+    """
+
+    __slots__ = ("override_name", "ignore_prefix")
+
+    def __init__(self):
+        self.override_name: Optional[str] = None
+        self.ignore_prefix: bool = False
 
 
 class EnvAdapter(AdapterBase):
@@ -53,36 +59,49 @@ class EnvAdapter(AdapterBase):
         """
 
         def wrapper(func):
-            env_config: _EnvAdapterConfig = FieldUtil.get_adapter_configs(func).get(
-                EnvAdapter, _EnvAdapterConfig()
-            )
+            adapter_configs = FieldUtil.get_adapter_configs(func)
+            env_config: Optional[_EnvAdapterConfig] = adapter_configs.get(EnvAdapter)
+            if env_config is None:
+                env_config = adapter_configs[EnvAdapter] = _EnvAdapterConfig()
             env_config.override_name = override_name
             env_config.ignore_prefix = ignore_prefix
-            FieldUtil.upsert_adapter_config(func, EnvAdapter, env_config)
             return func
 
         return wrapper
 
     def __init__(self, env_prefix: str = ""):
         self._env_prefix = env_prefix
+        # Environment variable name per field, as it does not change once decorated
+        self._env_names: Dict[Tuple[str, Callable[..., Any]], str] = {}
 
-    # pylint: disable=unused-argument
-    def get_field(
-        self, field_name: str, method: Callable[..., T], *args, **kwargs
-    ) -> str:
-        adapter_configs = FieldUtil.get_adapter_configs(method)
-
-        env_config: Optional[_EnvAdapterConfig] = adapter_configs.get(EnvAdapter)
+    def _get_env_name(self, field_name: str, method: Callable[..., T]) -> str:
+        """
+        Resolve environment variable name of the field from its config and prefix.
+        """
+        env_config: Optional[_EnvAdapterConfig] = FieldUtil.get_adapter_config(
+            method, EnvAdapter
+        )
 
         env_name = field_name.upper()
         if env_config and env_config.override_name is not None:
             env_name = env_config.override_name
 
-        prefix = self._env_prefix
-        if env_config and env_config.ignore_prefix:
-            prefix = ""
+        if self._env_prefix and not (env_config and env_config.ignore_prefix):
+            env_name = self._env_prefix + env_name
+        return env_name
+
+    # pylint: disable=unused-argument
+    def get_field(
+        self, field_name: str, method: Callable[..., T], *args, **kwargs
+    ) -> str:
+        cache_key = (field_name, method)
+        env_name = self._env_names.get(cache_key)
+        if env_name is None:
+            env_name = self._env_names[cache_key] = self._get_env_name(
+                field_name, method
+            )
 
-        env_name = prefix + env_name
-        if env_name not in os.environ:
+        value = os.environ.get(env_name)
+        if value is None:
             raise AdapterError(f"Environment variable {env_name} not found.")
-        return os.environ[env_name]
+        return value
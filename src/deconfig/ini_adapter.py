@@ -17,8 +17,10 @@ class ExampleConfig:
 
 import configparser
 import logging
-from dataclasses import dataclass
-from typing import Optional, List, Callable, Any, TypeVar
+import os
+import sys
+import threading
+from typing import Optional, List, Callable, Any, TypeVar, Dict, Tuple
 
 from deconfig.core import AdapterBase, FieldUtil, AdapterError
 
@@ -27,12 +29,27 @@ T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# pylint: disable=too-few-public-methods
 class _IniAdapterConfig:
-    option_name: Optional[str] = None
-    section_name: Optional[str] = None
-    file_paths: Optional[List[str]] = None
-    override_files: bool = True
+    """
+    INI lookup options of a field, set with @IniAdapter.configure.
+    """
+
+    __slots__ = (
+        "option_name",
+        "section_name",
+        "file_paths",
+        "override_files",
+        "option_key",
+    )
+
+    def __init__(self):
+        self.option_name: Optional[str] = None
+        self.section_name: Optional[str] = None
+        self.file_paths: Optional[List[str]] = None
+        self.override_files: bool = True
+        # Option name as keyed in parsed values, lowercased once when configured
+        self.option_key: Optional[str] = None
 
 
 class IniAdapter(AdapterBase):
@@ -55,6 +72,17 @@ class IniAdapter(AdapterBase):
     """
 
     _ini_adapter_default_paths: Optional[List[str]] = None
+    # Modification times, parser and option values read so far by (section, option)
+    # of parsed INI files, shared by all instances reading the same files
+    _files_cache: Dict[
+        Tuple[str, ...],
+        Tuple[
+            Tuple[Optional[int], ...],
+            configparser.ConfigParser,
+            Dict[Tuple[str, str], str],
+        ],
+    ] = {}
+    _files_cache_lock = threading.Lock()
 
     @staticmethod
     def configure(
@@ -90,13 +118,16 @@ class IniAdapter(AdapterBase):
         """
 
         def decorator(func: Callable[..., T]):
-            adapters = FieldUtil.get_adapter_configs(func)
-            config: _IniAdapterConfig = adapters.get(IniAdapter, _IniAdapterConfig())
+            adapter_configs = FieldUtil.get_adapter_configs(func)
+            config: Optional[_IniAdapterConfig] = adapter_configs.get(IniAdapter)
+            if config is None:
+                config = adapter_configs[IniAdapter] = _IniAdapterConfig()
             config.option_name = option_name
-            config.section_name = section_name
+            # Interned, as they are used as keys into parsed option values
+            config.option_key = sys.intern(option_name.lower()) if option_name else None
+            config.section_name = sys.intern(section_name) if section_name else None
             config.file_paths = file_paths
             config.override_files = override_files
-            FieldUtil.upsert_adapter_config(func, IniAdapter, config)
             return func
 
         return decorator
@@ -121,6 +152,54 @@ class IniAdapter(AdapterBase):
         """
         cls._ini_adapter_default_paths = file_paths
 
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """
+        Drop parsed INI files, so they are read again on next field lookup.
+        Changed files are detected by modification time, use this to force a re-read.
+        """
+        with cls._files_cache_lock:
+            cls._files_cache.clear()
+
+    @staticmethod
+    def _get_modification_times(
+        file_paths: Tuple[str, ...]
+    ) -> Tuple[Optional[int], ...]:
+        """
+        Get modification time of each INI file, None for files that cannot be read.
+        """
+        modification_times = []
+        for file_path in file_paths:
+            try:
+                modification_times.append(os.stat(file_path).st_mtime_ns)
+            except (OSError, TypeError, ValueError):
+                modification_times.append(None)
+        return tuple(modification_times)
+
+    @classmethod
+    def _get_parsed_files(
+        cls, file_paths: List[str]
+    ) -> Tuple[configparser.ConfigParser, Dict[Tuple[str, str], str]]:
+        """
+        Get parser of the INI files and option values read from it so far,
+        parsing the files when first used or changed.
+        """
+        cache_key = tuple(file_paths)
+        modification_times = cls._get_modification_times(cache_key)
+        cached = cls._files_cache.get(cache_key)
+        if cached is not None and cached[0] == modification_times:
+            return cached[1], cached[2]
+
+        with cls._files_cache_lock:
+            cached = cls._files_cache.get(cache_key)
+            if cached is not None and cached[0] == modification_times:
+                return cached[1], cached[2]
+            parser = configparser.ConfigParser()
+            parser.read(file_paths)
+            values = {}
+            cls._files_cache[cache_key] = (modification_times, parser, values)
+        return parser, values
+
     def __init__(
         self,
         section_name: str,
@@ -130,6 +209,11 @@ class IniAdapter(AdapterBase):
         self.file_names: Optional[List[str]] = file_names
         self.section_name: str = section_name
         self.override_files: bool = override_files
+        # Resolved lookup per (field name, getter), as it does not change once decorated
+        self._lookups: Dict[
+            Tuple[str, Callable[..., Any]], Tuple[Tuple[str, str], str, List[str]]
+        ] = {}
+        self._lookups_default_paths = self._ini_adapter_default_paths
         if self.file_names is None and self._ini_adapter_default_paths is None:
             logger.warning("No INI files specified for IniAdapter")
 
@@ -138,47 +222,77 @@ class IniAdapter(AdapterBase):
         configuration_file_names: Optional[List[str]] = None,
         configuration_override_files_flag: bool = False,
     ) -> List[str]:
-        ini_files = []
-        if self._ini_adapter_default_paths is not None:
-            ini_files.extend(self._ini_adapter_default_paths)
-        if self.override_files is True:
-            ini_files = []
-        if self.file_names is not None:
-            ini_files.extend(self.file_names)
-        if configuration_override_files_flag is True:
-            ini_files = []
-        if configuration_file_names is not None:
-            ini_files.extend(configuration_file_names)
+        # Collect only levels that are not overridden, instead of discarding them later
+        file_name_levels = [configuration_file_names]
+        if configuration_override_files_flag is not True:
+            file_name_levels.append(self.file_names)
+            if self.override_files is not True:
+                file_name_levels.append(self._ini_adapter_default_paths)
+
+        ini_files = [
+            file_name
+            for file_names in reversed(file_name_levels)
+            if file_names is not None
+            for file_name in file_names
+        ]
         if len(ini_files) == 0:
             raise ValueError("No INI files specified for IniAdapter")
         return ini_files
 
-    def get_field(
-        self, field_name: str, method: Callable[..., T], *method_args, **method_kwargs
-    ) -> Any:
+    def _resolve_lookup(
+        self, field_name: str, method: Callable[..., T]
+    ) -> Tuple[Tuple[str, str], str, List[str]]:
+        """
+        Resolve (section, option key) of parsed values, option name and INI files of the field.
+        """
         section_name = self.section_name
         option_name = field_name
+        option_key = None
 
-        adapter_configs = FieldUtil.get_adapter_configs(method)
-        ini_config: _IniAdapterConfig = adapter_configs.get(IniAdapter)
+        ini_config: Optional[_IniAdapterConfig] = FieldUtil.get_adapter_config(
+            method, IniAdapter
+        )
         if ini_config is not None:
             section_name = ini_config.section_name or section_name
             option_name = ini_config.option_name or option_name
+            option_key = ini_config.option_key
             file_paths = self._get_file_names(
                 ini_config.file_paths, ini_config.override_files
             )
         else:
             file_paths = self._get_file_names()
 
-        configparser_ = configparser.ConfigParser()
-        configparser_.read(file_paths)
-
         if section_name is None:
             raise ValueError("No section name specified for IniAdapter")
 
-        try:
-            return configparser_.get(section_name, option_name)
-        except configparser.NoOptionError as e:
-            raise AdapterError(
-                f"Field {option_name} not found in {section_name} section of {file_paths}"
-            ) from e
+        if option_key is None:
+            option_key = sys.intern(option_name.lower())
+        return (section_name, option_key), option_name, file_paths
+
+    def get_field(
+        self, field_name: str, method: Callable[..., T], *method_args, **method_kwargs
+    ) -> Any:
+        # Lookups depend on default INI files, drop them when defaults are changed
+        if self._lookups_default_paths is not self._ini_adapter_default_paths:
+            self._lookups = {}
+            self._lookups_default_paths = self._ini_adapter_default_paths
+
+        cache_key = (field_name, method)
+        lookup = self._lookups.get(cache_key)
+        if lookup is None:
+            lookup = self._lookups[cache_key] = self._resolve_lookup(field_name, method)
+        values_key, option_name, file_paths = lookup
+
+        parser, values = self._get_parsed_files(file_paths)
+        value = values.get(values_key)
+        if value is None:
+            # Options are interpolated only when read, so one bad value
+            # does not break lookups of other options
+            try:
+                value = parser.get(*values_key)
+            except (configparser.NoSectionError, configparser.NoOptionError) as e:
+                raise AdapterError(
+                    f"Field {option_name} not found in {values_key[0]} section of {file_paths}"
+                ) from e
+            values[values_key] = value
+        return value
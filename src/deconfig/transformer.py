@@ -65,12 +65,25 @@ def cast_datatype(
         ```
     """
 
+    return transform(_build_cast_callback(callback, cast_null))
+
+
+def _build_cast_callback(
+    callback: Callable[[T], T], cast_null: bool
+) -> Callable[[U], T]:
+    """
+    Build callback casting response.
+    """
+    if cast_null:
+        # None is cast as well, so callback can be used as is
+        return callback
+
     def callback_wrapper(response: U) -> T:
-        if response is None and cast_null is False:
+        if response is None:
             return None
         return callback(response)
 
-    return transform(callback_wrapper)
+    return callback_wrapper
 
 
 def string(cast_null: bool = False) -> Callable[..., Callable[..., str]]:
@@ -200,10 +213,18 @@ def comma_separated_array_string(
         if response is None and cast_null is False:
             return []
         if isinstance(response, bytes):
+            if element_cast in (int, float) and response.isascii():
+                # int and float parse ASCII bytes as they would the decoded string,
+                # so decoding can be skipped
+                return list(map(element_cast, response.split(b",")))
             response = response.decode("utf-8")
         if not isinstance(response, str):
             response = str(response)
-        return [element_cast(x) for x in response.split(",")]
+        elements = response.split(",")
+        if element_cast is str:
+            # Split already returns strings
+            return elements
+        return list(map(element_cast, elements))
 
     return transform(callback)
 
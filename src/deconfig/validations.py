@@ -9,6 +9,7 @@ Example Usage:
         return "app_settings"
 """
 
+import operator
 from enum import Enum
 from typing import Callable, TypeVar, Any, Type, Pattern, Optional
 from deconfig.__version__ import __version__, __author__, __license__
@@ -38,14 +39,14 @@ def validate(callback: Callable[[Any], None]) -> Callable[..., T]:
     is_callable(callback)
 
     def wrapper(func: Callable[..., T]) -> Callable[..., T]:
+        error_message = f'Validation failed for "{func.__name__}" method.'
+
         def validate_and_call(*args, **kwargs):
             response = func(*args, **kwargs)
             try:
                 callback(response)
             except ValueError as e:
-                raise ValueError(
-                    f'Validation failed for "{func.__name__}" method.'
-                ) from e
+                raise ValueError(error_message) from e
             return response
 
         validate_and_call: func = validate_and_call
@@ -61,9 +62,11 @@ def is_datatype(datatype: Type) -> Callable[..., None]:
     :raises ValueError: If the response is not of the specified datatype.
     """
 
+    error_message = f'Response is not a "{datatype.__name__}".'
+
     def validation_callback(response: Any) -> None:
         if not isinstance(response, datatype):
-            raise ValueError(f'Response is not a "{datatype.__name__}".')
+            raise ValueError(error_message)
 
     return validate(validation_callback)
 
@@ -93,17 +96,40 @@ def is_in_range(
     :raises ValueError: If the response is not within the range.
     """
 
+    # Pick comparisons and messages once, so validation only runs the needed checks
+    range_checks = []
+    if min_value is not None:
+        if left_inclusive:
+            range_checks.append(
+                (operator.lt, min_value, f"Response is less than {min_value}.")
+            )
+        else:
+            range_checks.append(
+                (
+                    operator.le,
+                    min_value,
+                    f"Response is less than or equal to {min_value}.",
+                )
+            )
+    if max_value is not None:
+        if right_inclusive:
+            range_checks.append(
+                (operator.gt, max_value, f"Response is greater than {max_value}.")
+            )
+        else:
+            range_checks.append(
+                (
+                    operator.ge,
+                    max_value,
+                    f"Response is greater than or equal to {max_value}.",
+                )
+            )
+    range_checks = tuple(range_checks)
+
     def validation_callback(response: Any) -> None:
-        if min_value is not None:
-            if left_inclusive and response < min_value:
-                raise ValueError(f"Response is less than {min_value}.")
-            if not left_inclusive and response <= min_value:
-                raise ValueError(f"Response is less than or equal to {min_value}.")
-        if max_value is not None:
-            if right_inclusive and response > max_value:
-                raise ValueError(f"Response is greater than {max_value}.")
-            if not right_inclusive and response >= max_value:
-                raise ValueError(f"Response is greater than or equal to {max_value}.")
+        for out_of_range, bound, message in range_checks:
+            if out_of_range(response, bound):
+                raise ValueError(message)
 
     return validate(validation_callback)
 
@@ -115,8 +141,10 @@ def matches_pattern(pattern: Pattern) -> Callable[..., None]:
     :raises ValueError: If the response does not match the pattern.
     """
 
+    match = pattern.match
+
     def validation_callback(response: Any) -> None:
-        if not pattern.match(response):
+        if not match(response):
             raise ValueError("Response does not match the pattern.")
 
     return validate(validation_callback)
@@ -0,0 +1,7 @@
+"""
+Helpers shared by `deconfig` tests
+"""
+
+
+def _noop():
+    """Stub callable for tests that do not make it a field"""
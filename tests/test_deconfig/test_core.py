@@ -3,13 +3,21 @@ Unit tests for the `deconfig.core` module
 """
 
 from typing import Type
-from unittest.mock import MagicMock
 
 import pytest
 
 from deconfig.core import FieldUtil, AdapterBase, is_callable
 
 
+class StubAdapter(AdapterBase):
+    def get_field(self, field_name, method, *method_args, **method_kwargs):
+        """Stub get_field"""
+
+
+class OtherStubAdapter(StubAdapter):
+    """Second stub adapter type"""
+
+
 @pytest.fixture(name="stub_function")
 def fixture_stub_function():
     def stub_function():
@@ -37,19 +45,41 @@ def test_Should_match_expected_When_is_callable_is_called(
         is_callable(callback_arg)
 
 
+def test_Should_raise_type_error_When_adapter_without_get_field_is_instantiated():
+    class IncompleteAdapter(AdapterBase):  # pylint: disable=abstract-method
+        """Adapter missing get_field"""
+
+    with pytest.raises(TypeError):
+        # pylint: disable=abstract-class-instantiated
+        IncompleteAdapter()
+
+
+class TestMeta:
+    def test_Should_return_none_When_get_meta_is_called_and_meta_is_not_set(
+        self, stub_function
+    ):
+        assert FieldUtil.get_meta(stub_function) is None
+
+    def test_Should_create_meta_once_When_initialize_meta_is_called(
+        self, stub_function
+    ):
+        meta = FieldUtil.initialize_meta(stub_function)
+        assert FieldUtil.get_meta(stub_function) is meta
+        assert FieldUtil.initialize_meta(stub_function) is meta
+
+
 class TestAdapterConfig:
     def test_Should_add_empty_dict_as_adapter_config_attribute_When_initialized(
         self, stub_function
     ):
         FieldUtil.initialize_adapter_configs(stub_function)
-        assert hasattr(stub_function, "adapter_configs")
-        assert getattr(stub_function, "adapter_configs") == {}
+        assert FieldUtil.get_meta(stub_function).adapter_configs == {}
 
     def test_Should_return_adapter_configs_When_get_adapter_configs_is_called(
         self, stub_function
     ):
         FieldUtil.initialize_adapter_configs(stub_function)
-        config = MagicMock()
+        config = object()
         FieldUtil.upsert_adapter_config(stub_function, AdapterBase, config)
         assert FieldUtil.get_adapter_configs(stub_function) == {AdapterBase: config}
 
@@ -59,21 +89,41 @@ class TestAdapterConfig:
         with pytest.raises(ValueError):
             FieldUtil.get_adapter_configs(stub_function)
 
+    def test_Should_return_adapter_config_When_get_adapter_config_is_called(
+        self, stub_function
+    ):
+        FieldUtil.initialize_adapter_configs(stub_function)
+        config = object()
+        FieldUtil.upsert_adapter_config(stub_function, AdapterBase, config)
+        assert FieldUtil.get_adapter_config(stub_function, AdapterBase) is config
+
+    def test_Should_return_none_When_get_adapter_config_is_called_and_adapter_config_is_not_set(
+        self, stub_function
+    ):
+        FieldUtil.initialize_adapter_configs(stub_function)
+        assert FieldUtil.get_adapter_config(stub_function, AdapterBase) is None
+
+    def test_Should_raise_error_When_get_adapter_config_is_called_and_adapter_configs_is_not_set(
+        self, stub_function
+    ):
+        with pytest.raises(ValueError):
+            FieldUtil.get_adapter_config(stub_function, AdapterBase)
+
     # noinspection PyTypeChecker
     def test_Should_add_adapter_config_When_upsert_adapter_config_is_called(
         self, stub_function
     ):
         FieldUtil.initialize_adapter_configs(stub_function)
-        adapter_1: Type[AdapterBase] = MagicMock(AdapterBase)
-        adapter_config_1 = MagicMock()
+        adapter_1: Type[AdapterBase] = StubAdapter
+        adapter_config_1 = object()
         FieldUtil.upsert_adapter_config(stub_function, adapter_1, adapter_config_1)
 
         assert FieldUtil.get_adapter_configs(stub_function) == {
             adapter_1: adapter_config_1
         }
 
-        adapter_2: Type[AdapterBase] = MagicMock(AdapterBase)
-        adapter_config_2 = MagicMock()
+        adapter_2: Type[AdapterBase] = OtherStubAdapter
+        adapter_config_2 = object()
         FieldUtil.upsert_adapter_config(stub_function, adapter_2, adapter_config_2)
         assert FieldUtil.get_adapter_configs(stub_function) == {
             adapter_1: adapter_config_1,
@@ -83,17 +133,32 @@ class TestAdapterConfig:
 
 class TestAdapters:
     def test_Should_set_adapters_When_set_adapters_is_called(self, stub_function):
-        adapters = [MagicMock()]
+        adapters = [object()]
         FieldUtil.set_adapters(stub_function, adapters)
-        assert getattr(stub_function, "adapters") == adapters
+        assert FieldUtil.get_meta(stub_function).adapters == adapters
 
     def test_Should_add_adapter_When_add_adapter_is_called(self, stub_function):
-        adapter = MagicMock()
+        adapter = object()
         FieldUtil.add_adapter(stub_function, adapter)
         assert FieldUtil.get_adapters(stub_function) == [adapter]
 
+    def test_Should_prepend_adapter_When_add_adapter_is_called_on_existing_adapters(
+        self, stub_function
+    ):
+        adapter_1 = object()
+        adapter_2 = object()
+        adapter_3 = object()
+        FieldUtil.set_adapters(stub_function, [adapter_1])
+        FieldUtil.add_adapter(stub_function, adapter_2)
+        FieldUtil.add_adapter(stub_function, adapter_3)
+        assert FieldUtil.get_adapters(stub_function) == [
+            adapter_3,
+            adapter_2,
+            adapter_1,
+        ]
+
     def test_Should_return_adapters_When_get_adapters_is_called(self, stub_function):
-        stub_adapter = MagicMock(AdapterBase)
+        stub_adapter = StubAdapter()
         FieldUtil.set_adapters(stub_function, [stub_adapter])
         assert FieldUtil.get_adapters(stub_function) == [stub_adapter]
 
@@ -110,7 +175,7 @@ class TestAdapters:
     def test_Should_return_true_When_has_adapters_is_called_and_adapters_is_set(
         self, stub_function
     ):
-        adapter = MagicMock(AdapterBase)
+        adapter = StubAdapter()
         FieldUtil.set_adapters(stub_function, [adapter])
         assert FieldUtil.has_adapters(stub_function) is True
 
@@ -119,7 +184,7 @@ class TestName:
     def test_Should_set_name_When_set_name_is_called(self, stub_function):
         name = "name"
         FieldUtil.set_name(stub_function, name)
-        assert getattr(stub_function, "name") == name
+        assert FieldUtil.get_meta(stub_function).name == name
 
     def test_Should_return_name_When_get_name_is_called(self, stub_function):
         name = "name"
@@ -148,14 +213,14 @@ class TestValidationCallback:
     def test_Should_add_validation_callback_When_add_validation_callback_is_called(
         self, stub_function
     ):
-        callback = MagicMock()
+        callback = object()
         stub_function = FieldUtil.add_validation_callback(stub_function, callback)
-        assert getattr(stub_function, "validation_callbacks") == [callback]
+        assert FieldUtil.get_meta(stub_function).validation_callbacks == [callback]
 
     def test_Should_return_validation_callback_When_get_validation_callback_is_called(
         self, stub_function
     ):
-        callback = MagicMock()
+        callback = object()
         FieldUtil.add_validation_callback(stub_function, callback)
         assert FieldUtil.get_validation_callbacks(stub_function) == [callback]
 
@@ -167,8 +232,8 @@ class TestValidationCallback:
     def test_Should_return_multiple_validations_When_multiple_validations_are_added(
         self, stub_function
     ):
-        callback1 = MagicMock()
-        callback2 = MagicMock()
+        callback1 = object()
+        callback2 = object()
         stub_function = FieldUtil.add_validation_callback(stub_function, callback1)
         stub_function = FieldUtil.add_validation_callback(stub_function, callback2)
         assert FieldUtil.get_validation_callbacks(stub_function) == [
@@ -180,7 +245,7 @@ class TestValidationCallback:
 class TestOptional:
     def test_Should_set_optional_When_set_optional_is_called(self, stub_function):
         FieldUtil.set_optional(stub_function, True)
-        assert getattr(stub_function, "optional") is True
+        assert FieldUtil.get_meta(stub_function).optional is True
 
     def test_Should_return_optional_When_is_optional_is_called(self, stub_function):
         FieldUtil.set_optional(stub_function, True)
@@ -196,14 +261,14 @@ class TestTransformCallback:
     def test_Should_add_transform_callback_When_add_transform_callback_is_called(
         self, stub_function
     ):
-        callback = MagicMock()
+        callback = object()
         stub_function = FieldUtil.add_transform_callback(stub_function, callback)
-        assert getattr(stub_function, "transform_callbacks", callback)
+        assert FieldUtil.get_meta(stub_function).transform_callbacks == [callback]
 
     def test_Should_return_transform_callback_When_get_transform_callback_is_called(
         self, stub_function
     ):
-        callback = MagicMock()
+        callback = object()
         stub_function = FieldUtil.add_transform_callback(stub_function, callback)
         assert FieldUtil.get_transform_callbacks(stub_function) == [callback]
 
@@ -215,8 +280,8 @@ class TestTransformCallback:
     def test_Should_append_to_existing_transform_callbacks_When_multiple_decorated_with_multiple_callbacks(
         self, stub_function
     ):
-        callback1 = MagicMock()
-        callback2 = MagicMock()
+        callback1 = object()
+        callback2 = object()
         stub_function = FieldUtil.add_transform_callback(stub_function, callback1)
         stub_function = FieldUtil.add_transform_callback(stub_function, callback2)
         assert FieldUtil.get_transform_callbacks(stub_function) == [
@@ -229,14 +294,14 @@ class TestCacheResponse:
     def test_Should_set_cached_response_When_set_cached_response_is_called(
         self, stub_function
     ):
-        response = MagicMock()
+        response = object()
         FieldUtil.set_cached_response(stub_function, response)
-        assert getattr(stub_function, "cached_response") == response
+        assert FieldUtil.get_meta(stub_function).cached_response == response
 
     def test_Should_return_cached_response_When_get_cached_response_is_called(
         self, stub_function
     ):
-        response = MagicMock()
+        response = object()
         FieldUtil.set_cached_response(stub_function, response)
         assert FieldUtil.get_cached_response(stub_function) == response
 
@@ -249,7 +314,7 @@ class TestCacheResponse:
     def test_Should_return_true_When_has_cached_response_is_called_and_cached_response_is_set(
         self, stub_function
     ):
-        FieldUtil.set_cached_response(stub_function, MagicMock())
+        FieldUtil.set_cached_response(stub_function, object())
         assert FieldUtil.has_cached_response(stub_function) is True
 
     def test_Should_return_false_When_has_cached_response_is_called_and_cached_response_is_not_set(
@@ -260,7 +325,7 @@ class TestCacheResponse:
     def test_Should_delete_cached_response_When_delete_cached_response_is_called(
         self, stub_function
     ):
-        response = MagicMock()
+        response = object()
         FieldUtil.set_cached_response(stub_function, response)
         FieldUtil.delete_cached_response(stub_function)
         assert FieldUtil.has_cached_response(stub_function) is False
@@ -276,14 +341,14 @@ class TestOriginalFunction:
     def test_Should_set_original_function_When_set_original_function_is_called(
         self, stub_function
     ):
-        original_function = MagicMock()
+        original_function = object()
         FieldUtil.set_original_function(stub_function, original_function)
-        assert getattr(stub_function, "original_function") == original_function
+        assert FieldUtil.get_meta(stub_function).original_function == original_function
 
     def test_Should_return_original_function_When_get_original_function_is_called(
         self, stub_function
     ):
-        original_function = MagicMock()
+        original_function = object()
         FieldUtil.set_original_function(stub_function, original_function)
         assert FieldUtil.get_original_function(stub_function) == original_function
 
@@ -296,7 +361,7 @@ class TestOriginalFunction:
     def test_Should_return_true_When_has_original_function_is_called_and_original_function_is_set(
         self, stub_function
     ):
-        FieldUtil.set_original_function(stub_function, MagicMock())
+        FieldUtil.set_original_function(stub_function, object())
         assert FieldUtil.has_original_function(stub_function) is True
 
     def test_Should_return_false_When_has_original_function_is_called_and_original_function_is_not_set(
@@ -2,7 +2,8 @@
 Unit tests for `deconfig` module
 """
 
-from unittest.mock import MagicMock
+import copy
+import pickle
 
 import pytest
 
@@ -19,11 +20,11 @@ from deconfig import (
     EnvAdapter,
 )
 from deconfig.core import AdapterBase, AdapterError, FieldUtil
+from tests.test_deconfig import _noop
 
 
-@pytest.mark.parametrize(
-    "import_name",
-    [
+def test_Should_have_expected_fields_When_deconfig_is_imported():
+    expected_names = (
         "field",
         "optional",
         "add_adapter",
@@ -31,19 +32,62 @@ from deconfig.core import AdapterBase, AdapterError, FieldUtil
         "config",
         "EnvAdapter",
         "IniAdapter",
-    ],
-    ids=[
-        "field",
-        "optional",
-        "add_adapter",
-        "set_default_adapters",
-        "config",
-        "EnvAdapter",
-        "IniAdapter",
-    ],
-)
-def test_Should_have_expected_field_When_deconfig_is_imported(import_name):
-    assert hasattr(deconfig, import_name)
+    )
+    missing_names = [name for name in expected_names if not hasattr(deconfig, name)]
+    assert not missing_names
+
+
+@pytest.fixture(name="default_adapters", autouse=True)
+def fixture_default_adapters(monkeypatch):
+    # Restore default adapters changed by set_default_adapters after each test
+    # pylint: disable=protected-access
+    monkeypatch.setattr(deconfig, "_adapters", deconfig._adapters)
+    return deconfig._adapters
+
+
+class SequenceAdapter(AdapterBase):
+    """Adapter returning given responses in order, raising the exceptions among them"""
+
+    def __init__(self, *responses):
+        self.responses = iter(responses)
+        self.call_count = 0
+
+    def get_field(self, field_name, method, *_, **__):
+        self.call_count += 1
+        response = next(self.responses)
+        if isinstance(response, BaseException) or (
+            isinstance(response, type) and issubclass(response, BaseException)
+        ):
+            raise response
+        return response
+
+
+class MissingAdapter(AdapterBase):
+    """Adapter without any fields"""
+
+    def get_field(self, field_name, method, *_, **__):
+        raise AdapterError(f"{field_name} not found")
+
+
+# Defined at module level, as pickle looks classes up by name
+@config([MissingAdapter()])
+class PicklableStubConfig:
+    """Config with fields returning value of the instance"""
+
+    def __init__(self, value):
+        self.value = value
+
+    @optional()
+    @field(name="first")
+    def first_field(self):
+        """First field"""
+        return self.value
+
+    @optional()
+    @field(name="second")
+    def second_field(self):
+        """Second field"""
+        return self.value
 
 
 @pytest.fixture(name="stub_callable")
@@ -59,11 +103,11 @@ class TestField:
     # pylint: disable=no-value-for-parameter
     def test_Should_raise_type_error_When_name_is_none_or_missing(self):
         with pytest.raises(TypeError) as e:
-            field()(lambda: None)
+            field()(_noop)
         assert str(e.value) == "field() missing 1 required positional argument: 'name'"
 
         with pytest.raises(TypeError) as e:
-            field(None)(lambda: None)
+            field(None)(_noop)
 
         assert str(e.value) == "Name is required."
 
@@ -73,7 +117,7 @@ class TestField:
                 raise TypeError("Not a string")
 
         with pytest.raises(TypeError):
-            field(StubNotString())(lambda: None)
+            field(StubNotString())(_noop)
 
     def test_Should_set_attribute_name_When_field_is_called(self):
         field_name = "stub_field_name"
@@ -93,17 +137,21 @@ class TestField:
         assert FieldUtil.get_adapter_configs(decorated_method) == {}
 
     def test_Should_return_same_function_When_field_is_called(self):
-        mock = MagicMock()
-        response_callback = field("test")(mock)
-        assert response_callback == mock
+        def stub_function():
+            """Stub function"""
+
+        response_callback = field("test")(stub_function)
+        assert response_callback is stub_function
 
 
 # noinspection PyTypeChecker
 class TestOptional:
     def test_Should_return_same_function_When_optional_is_called(self):
-        mock = MagicMock()
-        response_callback = optional()(mock)
-        assert response_callback == mock
+        def stub_function():
+            """Stub function"""
+
+        response_callback = optional()(stub_function)
+        assert response_callback is stub_function
 
     def test_Should_return_false_When_optional_is_not_set(self):
         @field(name="stub_function")
@@ -149,7 +197,8 @@ class TestOptional:
             optional(StubNotBool())(field(name="stub_field")(lambda: None))
 
 
-@pytest.fixture(name="stub_adapter")
+# Adapter holds no state, so it is shared by all tests of the module
+@pytest.fixture(name="stub_adapter", scope="module")
 def fixture_stub_adapter():
     class StubAdapter(AdapterBase):
         def get_field(self, field_name, method, *_, **__):
@@ -218,19 +267,20 @@ class TestAddAdapter:
         assert FieldUtil.has_adapters(field_decorated)
         assert FieldUtil.get_adapters(field_decorated) == [stub_adapter]
 
-    def test_Should_raise_value_error_When_argument_is_none(self):
+    @pytest.mark.parametrize(
+        "adapter_arg, expected_error_message",
+        [
+            (None, "Adapter is required."),
+            (1, "Adapter must extend AdapterBase or have get_field method."),
+        ],
+    )
+    def test_Should_raise_type_error_When_argument_is_not_adapter(
+        self, adapter_arg, expected_error_message
+    ):
         with pytest.raises(TypeError) as e:
-            add_adapter(None)(field(name="test")(lambda: None))
+            add_adapter(adapter_arg)(field(name="test")(lambda: None))
 
-        assert str(e.value) == "Adapter is required."
-
-    def test_Should_raise_value_error_When_argument_is_not_adapter_base(self):
-        with pytest.raises(TypeError) as e:
-            add_adapter(1)(field(name="test")(lambda: None))
-
-        assert (
-            str(e.value) == "Adapter must extend AdapterBase or have get_field method."
-        )
+        assert str(e.value) == expected_error_message
 
 
 # noinspection PyTypeChecker
@@ -300,7 +350,6 @@ class TestConfig:
 
     def test_Should_use_env_adapter_When_no_adapters_are_set(self, monkeypatch):
         monkeypatch.setenv("STUB_ENV_FIELD", "stub_env_response")
-        set_default_adapters(EnvAdapter())
 
         @config()
         class StubConfig:
@@ -410,6 +459,32 @@ class TestConfig:
         with pytest.raises(ValueError):
             stub_config.method_with_no_value()
 
+    def test_Should_keep_adapters_as_list_When_config_is_called(self, stub_adapter):
+        field_adapter = SequenceAdapter()
+
+        @config([stub_adapter])
+        class StubConfig:
+            @add_adapter(field_adapter)
+            @field(name="test")
+            def method_with_field_adapter(self):
+                """Field with adapter"""
+
+            @field(name="test_2")
+            def method_without_field_adapter(self):
+                """Field without adapter"""
+
+        with_field_adapter = FieldUtil.get_original_function(
+            StubConfig.method_with_field_adapter
+        )
+        without_field_adapter = FieldUtil.get_original_function(
+            StubConfig.method_without_field_adapter
+        )
+        assert FieldUtil.get_adapters(with_field_adapter) == [
+            field_adapter,
+            stub_adapter,
+        ]
+        assert FieldUtil.get_adapters(without_field_adapter) == [stub_adapter]
+
     def test_Should_use_class_adapters_When_field_missing_in_field_adapters(
         self, stub_adapter
     ):
@@ -455,13 +530,9 @@ class TestConfig:
     def test_Should_not_create_reset_deconfig_cache_When_class_already_has_reset_deconfig_cache_method(
         self,
     ):
-        adapter = MagicMock(AdapterBase)
-        adapter_response = MagicMock("adapter_response")
-        adapter.get_field.return_value = adapter_response
-
-        config_cache_stub = MagicMock()
+        config_cache_stub = object()
 
-        @config([adapter])
+        @config([SequenceAdapter()])
         class StubConfig:
             @field(name="test")
             def field_stub(self):
@@ -477,6 +548,12 @@ class TestConfig:
 
 
 class TestDecoratedConfigDecorator:
+    @staticmethod
+    def _decorate(getter_function, name, adapters):
+        FieldUtil.set_name(getter_function, name)
+        FieldUtil.set_adapters(getter_function, adapters)
+        return _decorated_config_decorator(getter_function)
+
     def test_Should_raise_value_error_When_adapters_are_not_present(
         self, stub_callable
     ):
@@ -509,6 +586,25 @@ class TestDecoratedConfigDecorator:
             stub_config.stub_field()
         assert str(e.value) == "Field test not found in any config."
 
+    def test_Should_chain_last_adapter_error_When_required_field_is_not_found(
+        self,
+    ):
+        class StubAdapter2(AdapterBase):
+            def get_field(self, field_name, method, *_, **__):
+                raise AdapterError(f"{field_name} not found in stub")
+
+        @config(adapters=[StubAdapter2()])
+        class StubConfig:
+            @field(name="test")
+            def stub_field(self):
+                """Stub field"""
+
+        stub_config = StubConfig()
+        with pytest.raises(ValueError) as e:
+            stub_config.stub_field()
+        assert isinstance(e.value.__cause__, AdapterError)
+        assert str(e.value.__cause__) == "test not found in stub"
+
     def test_Should_set_optional_to_true_When_optional_is_set_to_true(self):
         class StubAdapter2(AdapterBase):
             def get_field(self, field_name, method, *_, **__):
@@ -525,18 +621,14 @@ class TestDecoratedConfigDecorator:
         assert stub_config.stub_field() is None
 
     def test_Should_cache_response_When_invoked(self, stub_callable):
-        adapter = MagicMock()
-        adapter.get_field.side_effect = [1]
-        stub_callable.name = "test"
-        stub_callable.adapters = [adapter]
-        response = _decorated_config_decorator(stub_callable)
+        adapter = SequenceAdapter(1)
+        response = self._decorate(stub_callable, "test", [adapter])
         assert response() == 1
         assert response() == 1
-        assert adapter.get_field.call_count == 1
+        assert adapter.call_count == 1
 
     def test_Should_rebuild_value_When_cache_reset_using_reset_cache(self):
-        adapter = MagicMock(AdapterBase)
-        adapter.get_field.side_effect = [AdapterError, 1, 2]
+        adapter = SequenceAdapter(AdapterError, 1, 2)
 
         @config([adapter])
         class StubConfig:
@@ -548,31 +640,105 @@ class TestDecoratedConfigDecorator:
         stub_config = StubConfig()
         assert stub_config.stub_field() == 0
         assert stub_config.stub_field() == 0
-        assert adapter.get_field.call_count == 1
+        assert adapter.call_count == 1
         deconfig.reset_cache(stub_config)
         assert stub_config.stub_field() == 1
         assert stub_config.stub_field() == 1
-        assert adapter.get_field.call_count == 2
+        assert adapter.call_count == 2
         deconfig.reset_cache(stub_config)
         assert stub_config.stub_field() == 2
         assert stub_config.stub_field() == 2
-        assert adapter.get_field.call_count == 3
+        assert adapter.call_count == 3
 
-    def test_Should_call_adapters_in_sequence_When_invoked(self, stub_callable):
-        adapter_1 = MagicMock(AdapterBase)
-        adapter_2 = MagicMock(AdapterBase)
-        adapter_3 = MagicMock(AdapterBase)
-        adapter_1.get_field.side_effect = AdapterError("Value not found")
-        adapter_2.get_field.side_effect = [1]
-        adapter_3.get_field.side_effect = [None]
+    def test_Should_cache_response_per_instance_When_invoked_on_multiple_instances(
+        self,
+    ):
+        adapter = SequenceAdapter(1, 2, 3)
 
-        stub_callable.name = "test"
-        stub_callable.adapters = [adapter_1, adapter_2, adapter_3]
-        response = _decorated_config_decorator(stub_callable)
+        @config([adapter])
+        class StubConfig:
+            @field(name="test")
+            def stub_field(self):
+                """Stub field"""
+
+        stub_config_1 = StubConfig()
+        stub_config_2 = StubConfig()
+        assert stub_config_1.stub_field() == 1
+        assert stub_config_2.stub_field() == 2
+        assert stub_config_1.stub_field() == 1
+        assert adapter.call_count == 2
+        deconfig.reset_cache(stub_config_1)
+        assert stub_config_1.stub_field() == 3
+        assert stub_config_2.stub_field() == 2
+        assert adapter.call_count == 3
+
+    def test_Should_keep_cached_response_When_instance_is_pickled(self):
+        stub_config = PicklableStubConfig("value")
+        assert stub_config.first_field() == "value"
+        unpickled_config = pickle.loads(pickle.dumps(stub_config))
+        assert unpickled_config.first_field() == "value"
+        assert stub_config.first_field() == "value"
+
+    def test_Should_cache_response_per_copy_When_instance_is_copied(self):
+        stub_config = PicklableStubConfig("value")
+        assert stub_config.first_field() == "value"
+        copied_config = copy.copy(stub_config)
+        copied_config.value = "copied_value"
+        assert copied_config.second_field() == "copied_value"
+        assert stub_config.second_field() == "value"
+        assert copied_config.first_field() == "copied_value"
+        assert stub_config.first_field() == "value"
+
+    def test_Should_cache_response_per_arguments_When_getter_takes_arguments(self):
+        class StubAdapter(AdapterBase):
+            call_count = 0
+
+            def get_field(self, field_name, method, *args, **kwargs):
+                self.call_count += 1
+                return args[1:], kwargs
+
+        adapter = StubAdapter()
+
+        @config([adapter])
+        class StubConfig:
+            @field(name="test")
+            def stub_field(self, *_, **__):
+                """Stub field"""
+
+        stub_config = StubConfig()
+        assert stub_config.stub_field("a") == (("a",), {})
+        assert stub_config.stub_field("b") == (("b",), {})
+        assert stub_config.stub_field("a") == (("a",), {})
+        assert stub_config.stub_field(key="a") == ((), {"key": "a"})
+        assert adapter.call_count == 3
+        assert stub_config.stub_field(["a"]) == ((["a"],), {})
+        assert stub_config.stub_field(["a"]) == ((["a"],), {})
+        assert adapter.call_count == 5
+
+    def test_Should_not_cache_response_When_called_with_arguments_without_instance(
+        self,
+    ):
+        adapter = SequenceAdapter(1, 2)
+
+        def stub_field(*_):
+            """Stub field"""
+
+        response = self._decorate(stub_field, "test", [adapter])
+        assert response("a", "b") == 1
+        assert response("a", "c") == 2
+        assert adapter.call_count == 2
+
+    def test_Should_call_adapters_in_sequence_When_invoked(self, stub_callable):
+        adapter_1 = SequenceAdapter(AdapterError("Value not found"))
+        adapter_2 = SequenceAdapter(1)
+        adapter_3 = SequenceAdapter(None)
+        response = self._decorate(
+            stub_callable, "test", [adapter_1, adapter_2, adapter_3]
+        )
         response()
-        assert adapter_1.get_field.call_count == 1
-        assert adapter_2.get_field.call_count == 1
-        assert adapter_3.get_field.call_count == 0
+        assert adapter_1.call_count == 1
+        assert adapter_2.call_count == 1
+        assert adapter_3.call_count == 0
 
 
 class TestResetCache:
@@ -626,3 +792,110 @@ class TestResetCache:
         stub_config = StubConfig()
         deconfig.reset_cache(stub_config)
         assert stub_config.stub_field() == 1
+
+    def test_Should_reset_inherited_fields_When_reset_cache_is_invoked_on_subclass(
+        self,
+    ):
+        adapter = SequenceAdapter(1, 2, 3, 4)
+
+        @config([adapter])
+        class StubParentConfig:
+            """Stub Parent Config"""
+
+            @field(name="parent")
+            def parent_field(self):
+                """Parent field"""
+
+        @config([adapter])
+        class StubChildConfig(StubParentConfig):
+            """Stub Child Config"""
+
+            @field(name="child")
+            def child_field(self):
+                """Child field"""
+
+        stub_config = StubChildConfig()
+        assert stub_config.parent_field() == 1
+        assert stub_config.child_field() == 2
+        deconfig.reset_cache(stub_config)
+        assert stub_config.parent_field() == 3
+        assert stub_config.child_field() == 4
+
+    def test_Should_reset_instance_caches_When_reset_cache_is_invoked_on_class(self):
+        adapter = SequenceAdapter(1, 2, 3, 4)
+
+        @config([adapter])
+        class StubConfig:
+            """Stub Config"""
+
+            @field(name="test")
+            def stub_field(self):
+                """Stub field"""
+
+        class StubChildConfig(StubConfig):
+            """Stub Child Config"""
+
+        stub_config = StubConfig()
+        stub_child_config = StubChildConfig()
+        assert stub_config.stub_field() == 1
+        assert stub_child_config.stub_field() == 2
+        deconfig.reset_cache(StubConfig)
+        assert stub_config.stub_field() == 3
+        assert stub_child_config.stub_field() == 4
+        assert stub_config.stub_field() == 3
+        assert adapter.call_count == 4
+
+    def test_Should_reset_only_subclass_instances_When_reset_cache_is_invoked_on_subclass(
+        self,
+    ):
+        adapter = SequenceAdapter(1, 2, 3)
+
+        @config([adapter])
+        class StubConfig:
+            """Stub Config"""
+
+            @field(name="test")
+            def stub_field(self):
+                """Stub field"""
+
+        class StubChildConfig(StubConfig):
+            """Stub Child Config"""
+
+        stub_config = StubConfig()
+        stub_child_config = StubChildConfig()
+        assert stub_config.stub_field() == 1
+        assert stub_child_config.stub_field() == 2
+        deconfig.reset_cache(StubChildConfig)
+        assert stub_config.stub_field() == 1
+        assert stub_child_config.stub_field() == 3
+
+    def test_Should_skip_overridden_fields_When_reset_cache_is_invoked_on_subclass(
+        self,
+    ):
+        adapter = SequenceAdapter(1, 2)
+
+        @config([adapter])
+        class StubParentConfig:
+            """Stub Parent Config"""
+
+            @field(name="parent")
+            def parent_field(self):
+                """Parent field"""
+
+            @field(name="overridden")
+            def overridden_field(self):
+                """Overridden field"""
+
+        @config([adapter])
+        class StubChildConfig(StubParentConfig):
+            """Stub Child Config"""
+
+            def overridden_field(self):
+                return "not a field"
+
+        stub_config = StubChildConfig()
+        assert stub_config.parent_field() == 1
+        deconfig.reset_cache(stub_config)
+        deconfig.reset_cache(StubChildConfig)
+        assert stub_config.parent_field() == 2
+        assert stub_config.overridden_field() == "not a field"
@@ -4,6 +4,7 @@ Unit tests for `deconfig.env_adapter` module.
 
 import os
 from typing import Dict, Any
+from unittest import mock
 
 import pytest
 
@@ -11,6 +12,7 @@ from deconfig import field
 from deconfig.core import AdapterError
 from deconfig.env_adapter import EnvAdapter
 from deconfig.core import AdapterBase
+from tests.test_deconfig import _noop
 
 
 class TestEnvAdapter:
@@ -110,6 +112,33 @@ class TestEnvAdapter:
         )
         assert adapter.get_field(field_name, field_callback) == "stub_value"
 
+    def test_Should_read_current_environment_When_get_field_is_called_again(self):
+        adapter = EnvAdapter()
+        field_callback = field(name="stub")(lambda: None)
+        os.environ["STUB"] = "stub_value"
+        assert adapter.get_field("stub", field_callback) == "stub_value"
+
+        os.environ["STUB"] = "changed_value"
+        assert adapter.get_field("stub", field_callback) == "changed_value"
+
+        del os.environ["STUB"]
+        with pytest.raises(AdapterError):
+            adapter.get_field("stub", field_callback)
+
+    def test_Should_read_patched_environment_When_os_environ_is_replaced(self):
+        adapter = EnvAdapter()
+        field_callback = field(name="stub")(lambda: None)
+        with mock.patch.object(os, "environ", {"STUB": "patched_value"}):
+            assert adapter.get_field("stub", field_callback) == "patched_value"
+
+    def test_Should_return_empty_string_When_env_variable_is_set_to_empty_string(
+        self,
+    ):
+        adapter = EnvAdapter()
+        os.environ["STUB"] = ""
+        field_callback = field(name="stub")(lambda: None)
+        assert adapter.get_field("stub", field_callback) == ""
+
     def test_Should_raise_attribute_error_When_env_variable_is_not_set(self):
         adapter = EnvAdapter()
         field_callback = field("stub")(lambda: None)
@@ -119,4 +148,4 @@ class TestEnvAdapter:
     def test_Should_raise_value_error_When_get_field_is_called_on_normal_method(self):
         adapter = EnvAdapter()
         with pytest.raises(ValueError):
-            adapter.get_field("STUB", lambda: None)
+            adapter.get_field("STUB", _noop)
@@ -2,13 +2,14 @@
 Unit tests for the `deconfig.ini_adapter` module.
 """
 
-from configparser import NoOptionError
+import os
+from configparser import InterpolationSyntaxError, NoOptionError, NoSectionError
 from unittest.mock import patch
 
 import pytest
 
 from deconfig import IniAdapter, field
-from deconfig.core import AdapterBase, AdapterError
+from deconfig.core import AdapterBase, AdapterError, FieldUtil
 
 
 @pytest.fixture(name="field_decorated_callable")
@@ -22,10 +23,31 @@ def fixture_field_decorated_callable():
 
 @pytest.fixture(name="configparser")
 def fixture_configparser():
+    IniAdapter.invalidate_cache()
     with patch(
         f"{IniAdapter.__module__}.configparser.ConfigParser", autospec=True
     ) as parser:
+        _stub_ini_values(parser, {"section_a": {"option_a": "value"}})
         yield parser
+    IniAdapter.invalidate_cache()
+
+
+@pytest.fixture(name="ini_file")
+def fixture_ini_file(tmp_path):
+    IniAdapter.invalidate_cache()
+    yield tmp_path / "config.ini"
+    IniAdapter.invalidate_cache()
+
+
+def _stub_ini_values(configparser, values):
+    def get(section, option, **_):
+        if section not in values:
+            raise NoSectionError(section)
+        if option not in values[section]:
+            raise NoOptionError(option, section)
+        return values[section][option]
+
+    configparser.return_value.get.side_effect = get
 
 
 def _flatten_array(array_of_array):
@@ -162,14 +184,14 @@ def test_Should_ignore_default_and_constructor_file_paths_When_configuration_ove
 def test_Should_use_constructor_section_name_When_looking_config_parser(
     field_decorated_callable, configparser, section_name
 ):
+    _stub_ini_values(configparser, {section_name: {"option_a": "value"}})
     adapter = IniAdapter(section_name)
     configured_callable = IniAdapter.configure()(field_decorated_callable)
     if section_name is None:
         with pytest.raises(ValueError):
             _ = adapter.get_field("option_a", configured_callable)
         return
-    _ = adapter.get_field("option_a", configured_callable)
-    configparser.return_value.get.assert_called_once_with(section_name, "option_a")
+    assert adapter.get_field("option_a", configured_callable) == "value"
 
 
 @pytest.mark.parametrize(
@@ -193,14 +215,12 @@ def test_Should_use_configuration_section_name_When_specified(
         field_decorated_callable
     )
     expected_section_name = configuration_section_name or constructor_section_name
+    _stub_ini_values(configparser, {expected_section_name: {"option_a": "value"}})
     if expected_section_name is None:
         with pytest.raises(ValueError):
             _ = adapter.get_field("option_a", configured_callable)
         return
-    _ = adapter.get_field("option_a", configured_callable)
-    configparser.return_value.get.assert_called_once_with(
-        expected_section_name, "option_a"
-    )
+    assert adapter.get_field("option_a", configured_callable) == "value"
 
 
 @pytest.mark.parametrize(
@@ -220,25 +240,37 @@ def test_Should_use_configuration_field_name_When_specified(
         field_decorated_callable
     )
     expected_field_name = option_name or field_name
-    _ = adapter.get_field(field_name, configured_callable)
-    configparser.return_value.get.assert_called_once_with(
-        "section_a", expected_field_name
+    # ConfigParser stores option names lowercase
+    _stub_ini_values(
+        configparser, {"section_a": {expected_field_name.lower(): "value"}}
+    )
+    assert adapter.get_field(field_name, configured_callable) == "value"
+
+
+def test_Should_store_lowercase_option_key_When_configured_with_option_name(
+    field_decorated_callable,
+):
+    configured_callable = IniAdapter.configure(option_name="Stub_Option")(
+        field_decorated_callable
     )
+    ini_config = FieldUtil.get_adapter_config(configured_callable, IniAdapter)
+    assert ini_config.option_name == "Stub_Option"
+    assert ini_config.option_key == "stub_option"
 
 
 def test_Should_use_field_and_constructor_args_When_configuration_is_not_specified(
     field_decorated_callable, configparser
 ):
     IniAdapter.set_default_ini_files(["default.ini"])
+    _stub_ini_values(configparser, {"section_a": {"stub_field": "value"}})
     adapter = IniAdapter("section_a")
-    _ = adapter.get_field("stub_field", field_decorated_callable)
-    configparser.return_value.get.assert_called_once_with("section_a", "stub_field")
+    assert adapter.get_field("stub_field", field_decorated_callable) == "value"
 
 
 def test_Should_raise_adapter_error_When_section_or_option_is_not_found(
     field_decorated_callable, configparser
 ):
-    configparser.return_value.get.side_effect = NoOptionError("option_a", "section_a")
+    _stub_ini_values(configparser, {"section_a": {}})
     IniAdapter.set_default_ini_files(["default.ini"])
     adapter = IniAdapter("section_a")
     with pytest.raises(AdapterError) as e:
@@ -247,8 +279,85 @@ def test_Should_raise_adapter_error_When_section_or_option_is_not_found(
 
 
 def test_Should_return_option_value_When_found(field_decorated_callable, configparser):
-    configparser.return_value.get.return_value = "option_a_value"
+    _stub_ini_values(configparser, {"section_a": {"option_a": "option_a_value"}})
     adapter = IniAdapter("section_a", file_names=["default.ini"])
     result = adapter.get_field("option_a", field_decorated_callable)
     assert result == "option_a_value"
-    configparser.return_value.get.assert_called_once_with("section_a", "option_a")
+
+
+def test_Should_parse_ini_files_once_When_field_is_read_multiple_times(
+    field_decorated_callable, configparser
+):
+    IniAdapter.set_default_ini_files(None)
+    adapter = IniAdapter("section_a", file_names=["default.ini"])
+    _ = adapter.get_field("option_a", field_decorated_callable)
+    _ = adapter.get_field("option_a", field_decorated_callable)
+    configparser.assert_called_once_with()
+    configparser.return_value.read.assert_called_once_with(["default.ini"])
+
+
+def test_Should_parse_ini_files_again_When_cache_is_invalidated(
+    field_decorated_callable, configparser
+):
+    adapter = IniAdapter("section_a", file_names=["default.ini"])
+    _ = adapter.get_field("option_a", field_decorated_callable)
+    IniAdapter.invalidate_cache()
+    _ = adapter.get_field("option_a", field_decorated_callable)
+    assert configparser.return_value.read.call_count == 2
+
+
+def test_Should_raise_adapter_error_When_section_is_not_found(
+    field_decorated_callable, configparser
+):
+    _stub_ini_values(configparser, {"section_b": {"option_a": "value"}})
+    adapter = IniAdapter("section_a", file_names=["default.ini"])
+    with pytest.raises(AdapterError):
+        _ = adapter.get_field("option_a", field_decorated_callable)
+
+
+def test_Should_read_values_from_ini_file_When_file_is_parsed(
+    field_decorated_callable, ini_file
+):
+    ini_file.write_text(
+        "[DEFAULT]\nbase = /srv\n\n[section_a]\nOption_A = %(base)s/app\n"
+    )
+    adapter = IniAdapter("section_a", file_names=[str(ini_file)], override_files=True)
+    assert adapter.get_field("option_a", field_decorated_callable) == "/srv/app"
+    assert adapter.get_field("Option_A", field_decorated_callable) == "/srv/app"
+    assert adapter.get_field("base", field_decorated_callable) == "/srv"
+
+
+def test_Should_read_option_When_other_option_cannot_be_interpolated(
+    field_decorated_callable, ini_file
+):
+    ini_file.write_text("[section_a]\nname = svc\ndiscount = 50%\n")
+    adapter = IniAdapter("section_a", file_names=[str(ini_file)], override_files=True)
+    assert adapter.get_field("name", field_decorated_callable) == "svc"
+    with pytest.raises(InterpolationSyntaxError):
+        adapter.get_field("discount", field_decorated_callable)
+
+
+def test_Should_use_new_default_files_When_defaults_are_changed_after_lookup(
+    field_decorated_callable, configparser
+):
+    IniAdapter.set_default_ini_files(["default.ini"])
+    adapter = IniAdapter("section_a")
+    _ = adapter.get_field("option_a", field_decorated_callable)
+    configparser.return_value.read.assert_called_once_with(["default.ini"])
+
+    IniAdapter.set_default_ini_files(["other.ini"])
+    _ = adapter.get_field("option_a", field_decorated_callable)
+    configparser.return_value.read.assert_called_with(["other.ini"])
+
+
+def test_Should_read_ini_file_again_When_file_is_modified(
+    field_decorated_callable, ini_file
+):
+    ini_file.write_text("[section_a]\noption_a = old\n")
+    adapter = IniAdapter("section_a", file_names=[str(ini_file)], override_files=True)
+    assert adapter.get_field("option_a", field_decorated_callable) == "old"
+
+    ini_file.write_text("[section_a]\noption_a = new\n")
+    modification_time = ini_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(ini_file, ns=(modification_time, modification_time))
+    assert adapter.get_field("option_a", field_decorated_callable) == "new"
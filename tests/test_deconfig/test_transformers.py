@@ -6,6 +6,8 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from deconfig import config, field, optional
+from deconfig.core import AdapterBase, AdapterError
 from deconfig.transformer import (
     transform,
     cast_datatype,
@@ -15,6 +17,7 @@ from deconfig.transformer import (
     floating,
     comma_separated_array_string,
 )
+from tests.test_deconfig import _noop
 
 
 class TestTransform:
@@ -22,7 +25,7 @@ class TestTransform:
         self,
     ):
         transformer_stub = MagicMock()
-        response = MagicMock()
+        response = object()
 
         @transform(transformer_stub)
         def stub_function():
@@ -31,24 +34,57 @@ class TestTransform:
         assert stub_function() == transformer_stub.return_value
         transformer_stub.assert_called_once_with(response)
 
-    # noinspection PyArgumentList,PyTypeChecker
+    def test_Should_transform_only_getter_response_When_field_wraps_transformer(
+        self,
+    ):
+        class StubAdapter(AdapterBase):
+            def get_field(self, field_name, method, *_, **__):
+                if field_name == "missing":
+                    raise AdapterError("Intentional error")
+                return "adapter_value"
+
+        @config([StubAdapter()])
+        class StubConfig:
+            @field(name="stub")
+            @transform(str.upper)
+            def stub_field(self):
+                """Stub field"""
+                return "default"
+
+            @optional()
+            @field(name="missing")
+            @transform(str.upper)
+            def missing_field(self):
+                """Stub field"""
+                return "default"
+
+        stub_config = StubConfig()
+        assert stub_config.stub_field() == "adapter_value"
+        assert stub_config.missing_field() == "DEFAULT"
+
+    # noinspection PyArgumentList
     def test_Should_raise_type_error_When_transformer_is_missing(self):
         with pytest.raises(TypeError) as e:
-            transform(None)(lambda: None)
-        assert str(e.value) == "Callback is required."
-
-        with pytest.raises(TypeError) as e:
-            transform()(lambda: None)  # pylint: disable=no-value-for-parameter
+            transform()(_noop)  # pylint: disable=no-value-for-parameter
         assert (
             str(e.value)
             == "transform() missing 1 required positional argument: 'callback'"
         )
 
     # noinspection PyTypeChecker
-    def test_Should_raise_type_error_When_transformer_is_not_callable(self):
+    @pytest.mark.parametrize(
+        "callback_arg, expected_error_message",
+        [
+            (None, "Callback is required."),
+            (1, "Callback must be a callable."),
+        ],
+    )
+    def test_Should_raise_type_error_When_transformer_is_not_callable(
+        self, callback_arg, expected_error_message
+    ):
         with pytest.raises(TypeError) as e:
-            transform(1)(lambda: None)
-        assert str(e.value) == "Callback must be a callable."
+            transform(callback_arg)(_noop)
+        assert str(e.value) == expected_error_message
 
 
 @pytest.mark.parametrize(
@@ -167,6 +203,11 @@ def test_Should_cast_response_to_float_When_decorated_with_floating(
         (None, str, True, ["None"]),
         (None, str, False, []),
         (b"foo,bar", str, False, ["foo", "bar"]),
+        ("a,b", str.upper, False, ["A", "B"]),
+        (b"1,2", int, False, [1, 2]),
+        (b"1.5, 2", float, False, [1.5, 2.0]),
+        ("\u0661,\u0662".encode(), int, False, [1, 2]),
+        ("\u0661.5".encode(), float, False, [1.5]),
     ],
 )
 def test_Should_cast_response_to_comma_separated_array_string_When_decorated_with_comma_separated_array_string(
@@ -179,6 +220,15 @@ def test_Should_cast_response_to_comma_separated_array_string_When_decorated_wit
     assert stub_function() == expected_value
 
 
+def test_Should_raise_unicode_decode_error_When_bytes_are_not_utf_8():
+    @comma_separated_array_string(int)
+    def stub_function():
+        return b"1,\xff"
+
+    with pytest.raises(UnicodeDecodeError):
+        stub_function()
+
+
 @pytest.mark.parametrize(
     "import_name",
     [
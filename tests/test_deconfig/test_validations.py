@@ -8,6 +8,8 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from deconfig import add_adapter, config, field, optional
+from deconfig.core import AdapterBase, AdapterError
 from deconfig.validations import (
     validate,
     is_datatype,
@@ -18,12 +20,13 @@ from deconfig.validations import (
     min_length,
     is_in_enum,
 )
+from tests.test_deconfig import _noop
 
 
 class TestValidate:
     def test_Should_validate_against_callback_When_decorated_with_validate(self):
         callable_stub = MagicMock()
-        callable_stub.side_effect = [MagicMock(), ValueError]
+        callable_stub.side_effect = [None, ValueError]
 
         @validate(callable_stub)
         def stub_function():
@@ -39,24 +42,59 @@ class TestValidate:
         assert str(e.value) == 'Validation failed for "stub_function" method.'
         assert callable_stub.call_count == 2
 
-    # noinspection PyTypeChecker,PyArgumentList
-    def test_Should_raise_type_error_When_callback_is_missing(self):
-        with pytest.raises(TypeError) as e:
-            validate(None)(lambda: None)
-        assert str(e.value) == "Callback is required."
+    def test_Should_validate_only_getter_response_When_field_wraps_validation(self):
+        class EmptyAdapter(AdapterBase):
+            """Adapter without any field"""
+
+            def get_field(self, field_name, method, *_, **__):
+                raise AdapterError(f"{field_name} not set")
+
+        validation_callback = MagicMock(side_effect=ValueError)
+
+        @config([EmptyAdapter()])
+        class StubConfig:
+            @add_adapter(MagicMock(get_field=MagicMock(return_value="adapter_value")))
+            @field(name="stub")
+            @validate(validation_callback)
+            def stub_field(self):
+                """Stub field"""
+
+            @optional()
+            @field(name="missing")
+            @validate(validation_callback)
+            def missing_field(self):
+                """Stub field"""
+
+        stub_config = StubConfig()
+        assert stub_config.stub_field() == "adapter_value"
+        validation_callback.assert_not_called()
+        with pytest.raises(ValueError) as e:
+            stub_config.missing_field()
+        assert str(e.value) == 'Validation failed for "missing_field" method.'
 
+    # noinspection PyArgumentList
+    def test_Should_raise_type_error_When_callback_is_missing(self):
         with pytest.raises(TypeError) as e:
-            validate()(lambda: None)  # pylint: disable=no-value-for-parameter
+            validate()(_noop)  # pylint: disable=no-value-for-parameter
         assert (
             str(e.value)
             == "validate() missing 1 required positional argument: 'callback'"
         )
 
     # noinspection PyTypeChecker
-    def test_Should_raise_type_error_When_callback_is_not_callable(self):
+    @pytest.mark.parametrize(
+        "callback_arg, expected_error_message",
+        [
+            (None, "Callback is required."),
+            (1, "Callback must be a callable."),
+        ],
+    )
+    def test_Should_raise_type_error_When_callback_is_not_callable(
+        self, callback_arg, expected_error_message
+    ):
         with pytest.raises(TypeError) as e:
-            validate(1)(lambda: None)
-        assert str(e.value) == "Callback must be a callable."
+            validate(callback_arg)(_noop)
+        assert str(e.value) == expected_error_message
 
 
 class TestIsDatatype:
@@ -139,6 +177,11 @@ class TestIsNotEmpty:
         (4, 1, 2, True, False, False),
         (4, 1, 2, False, False, False),
         ("41", "1", "5", False, False, True),
+        (-4, None, 2, True, True, True),
+        (4, None, 2, True, True, False),
+        (4, 1, None, True, True, True),
+        (0, 1, None, True, True, False),
+        (4, None, None, False, False, True),
     ],
 )
 def test_Should_validate_in_range_When_decorated_with_is_in_range(